@@ -4,47 +4,141 @@ A comprehensive management system for contacts, appointments, and tasks.
 Provides CRUD operations with validation for all data types.
 """
 
+import os
 import re
-from datetime import datetime
+import sys
+from dataclasses import dataclass
+from typing import TextIO
+
+# ==============================================================================
+# DATA MODELS
+# ==============================================================================
+# Slotted record types: fixed per-record layout instead of a dict per entry
+
+@dataclass(slots=True)
+class Contact:
+    """A single contact record."""
+    name: str
+    email: str
+    phone: int       # 10-digit number stored as int; format with :010d
+
+@dataclass(slots=True)
+class Appointment:
+    """A single appointment record."""
+    title: str       # interned: titles repeat heavily across appointments
+    date_time: int   # packed by _pack_dt; format with _unpack_dt
+    location: str    # interned: locations repeat heavily across appointments
+
+@dataclass(slots=True)
+class Task:
+    """A single task record."""
+    description: str
+    due_date: int    # packed by _pack_dt; format with _unpack_dt
 
 # ==============================================================================
 # DATA STORES
 # ==============================================================================
 # Global dictionaries to store application data
-contacts = {}        # Stores contact information {contact_id: {name, email, phone}}
-appointments = {}    # Stores appointments {app_id: {title, date_time, location}}
-tasks = {}           # Stores tasks {task_id: {description, due_date}}
+contacts: dict[str, Contact] = {}          # Stores contact information {contact_id: Contact}
+appointments: dict[str, Appointment] = {}  # Stores appointments {app_id: Appointment}
+tasks: dict[str, Task] = {}                # Stores tasks {task_id: Task}
 
 # ==============================================================================
 # VALIDATION HELPERS
 # ==============================================================================
 # Functions to validate user input across the application
 
-def validate_email(email):
+# Days in each month for a non-leap year (index 0 = January)
+DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# YYYY-MM-DD HH:MM with month, day, hour and minute ranges enforced by the
+# pattern itself; compiled once at import time. re.ASCII limits \d to 0-9 so
+# packed dates always format back to exactly what the user typed.
+_DATE_RE = re.compile(
+    r"\A(\d{4})-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01]) ([01]\d|2[0-3]):([0-5]\d)\Z",
+    re.ASCII,
+)
+
+def validate_email(email: str) -> bool:
     """
-    Validate email format using regex.
+    Validate email format (local@domain.tld).
+    
+    Requires a non-empty local part before the first '@', followed by a
+    domain segment containing a '.' with characters on both sides of it.
     
     Args:
         email (str): Email address to validate
         
     Returns:
-        Match object if valid, None if invalid
+        bool: True if valid format, False otherwise
     """
-    return re.match(r"[^@]+@[^@]+\.[^@]+", email)
+    at = email.find("@")
+    if at <= 0:
+        return False
+    # The domain segment runs up to the next '@' (or the end of the string)
+    end = email.find("@", at + 1)
+    if end == -1:
+        end = len(email)
+    dot = email.find(".", at + 2, end)
+    return dot != -1 and dot < end - 1
 
-def validate_phone(phone):
+def validate_phone(phone: str) -> bool:
     """
-    Validate phone number format (must be exactly 10 digits).
+    Validate phone number format (must be exactly 10 ASCII digits).
+    
+    Only ASCII digits are accepted because valid numbers are stored as int;
+    other Unicode digits would not round-trip to the text the user entered.
     
     Args:
         phone (str): Phone number to validate
         
     Returns:
-        Match object if valid, None if invalid
+        bool: True if valid format, False otherwise
+    """
+    return len(phone) == 10 and phone.isascii() and phone.isdecimal()
+
+def _pack_dt(date_str: str) -> int | None:
+    """
+    Parse a YYYY-MM-DD HH:MM string into a single sortable integer.
+    
+    The value is ((year*13 + month)*32 + day)*1440 + hour*60 + minute, so
+    packed dates compare in chronological order.
+    
+    Args:
+        date_str (str): Date string to parse
+        
+    Returns:
+        int: Packed date/time, or None if the format or values are invalid
+    """
+    match = _DATE_RE.match(date_str)
+    if match is None:
+        return None
+    year, month, day, hour, minute = map(int, match.groups())
+    # The pattern caps days at 31; check the real month length (and year 0)
+    max_day = DAYS_IN_MONTH[month - 1]
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        max_day = 29
+    if year < 1 or day > max_day:
+        return None
+    return ((year * 13 + month) * 32 + day) * 1440 + hour * 60 + minute
+
+def _unpack_dt(packed: int) -> str:
+    """
+    Format a packed date/time back into YYYY-MM-DD HH:MM.
+    
+    Args:
+        packed (int): Value produced by _pack_dt
+        
+    Returns:
+        str: Canonical date string
     """
-    return re.match(r"\d{10}$", phone)
+    date, minutes = divmod(packed, 1440)
+    date, day = divmod(date, 32)
+    year, month = divmod(date, 13)
+    hour, minute = divmod(minutes, 60)
+    return f"{year:04d}-{month:02d}-{day:02d} {hour:02d}:{minute:02d}"
 
-def validate_date(date_str):
+def validate_date(date_str: str) -> bool:
     """
     Validate date and time format (YYYY-MM-DD HH:MM).
     
@@ -54,17 +148,13 @@ def validate_date(date_str):
     Returns:
         bool: True if valid format, False otherwise
     """
-    try:
-        datetime.strptime(date_str, "%Y-%m-%d %H:%M")
-        return True
-    except ValueError:
-        return False
+    return _pack_dt(date_str) is not None
 
 # ==============================================================================
 # CONTACT MANAGEMENT FUNCTIONS
 # ==============================================================================
 
-def create_contact(contact_id, name, email, phone):
+def create_contact(contact_id: str, name: str, email: str, phone: str) -> str:
     """
     Create a new contact with validation.
     
@@ -81,10 +171,11 @@ def create_contact(contact_id, name, email, phone):
         return "Invalid email format."
     if not validate_phone(phone):
         return "Phone must be 10 digits."
-    contacts[contact_id] = {"name": name, "email": email, "phone": phone}
+    contacts[contact_id] = Contact(name, email, int(phone))
     return f"Contact '{name}' created."
 
-def update_contact(contact_id, name=None, email=None, phone=None):
+def update_contact(contact_id: str, name: str | None = None, email: str | None = None,
+                   phone: str | None = None) -> str:
     """
     Update an existing contact's information.
     
@@ -97,22 +188,53 @@ def update_contact(contact_id, name=None, email=None, phone=None):
     Returns:
         str: Success or error message
     """
-    if contact_id not in contacts:
+    rec = contacts.get(contact_id)
+    if rec is None:
         return "Contact not found."
     if email and not validate_email(email):
         return "Invalid email format."
     if phone and not validate_phone(phone):
         return "Phone must be 10 digits."
-    if name: contacts[contact_id]["name"] = name
-    if email: contacts[contact_id]["email"] = email
-    if phone: contacts[contact_id]["phone"] = phone
+    if name: rec.name = name
+    if email: rec.email = email
+    if phone: rec.phone = int(phone)
     return f"Contact '{contact_id}' updated."
 
+def bulk_create_contacts(contact_ids: list[str], names: list[str], emails: list[str],
+                         phones: list[str]) -> str:
+    """
+    Create many contacts in one pass (e.g. rows from a CSV import).
+
+    Rows are read in lockstep from the four columns, which must all have
+    the same length; nothing is stored if they differ. Rows that fail email
+    or phone validation are skipped; valid rows are stored as with
+    create_contact.
+
+    Args:
+        contact_ids (list[str]): Unique identifiers, one per row
+        names (list[str]): Contact names
+        emails (list[str]): Email addresses
+        phones (list[str]): Phone numbers (10 digits)
+
+    Returns:
+        str: Summary of created and rejected rows, or error message
+    """
+    if not len(contact_ids) == len(names) == len(emails) == len(phones):
+        return "Column lengths do not match."
+    created = rejected = 0
+    for contact_id, name, email, phone in zip(contact_ids, names, emails, phones):
+        if validate_email(email) and validate_phone(phone):
+            contacts[contact_id] = Contact(name, email, int(phone))
+            created += 1
+        else:
+            rejected += 1
+    return f"{created} contact(s) created, {rejected} rejected."
+
 # ==============================================================================
 # APPOINTMENT MANAGEMENT FUNCTIONS
 # ==============================================================================
 
-def create_appointment(app_id, title, date_time, location):
+def create_appointment(app_id: str, title: str, date_time: str, location: str) -> str:
     """
     Create a new appointment with validation.
     
@@ -125,12 +247,14 @@ def create_appointment(app_id, title, date_time, location):
     Returns:
         str: Success or error message
     """
-    if not validate_date(date_time):
+    packed = _pack_dt(date_time)
+    if packed is None:
         return "Invalid date format. Use YYYY-MM-DD HH:MM"
-    appointments[app_id] = {"title": title, "date_time": date_time, "location": location}
+    appointments[app_id] = Appointment(sys.intern(title), packed, sys.intern(location))
     return f"Appointment '{title}' created."
 
-def update_appointment(app_id, title=None, date_time=None, location=None):
+def update_appointment(app_id: str, title: str | None = None, date_time: str | None = None,
+                       location: str | None = None) -> str:
     """
     Update an existing appointment's information.
     
@@ -143,20 +267,22 @@ def update_appointment(app_id, title=None, date_time=None, location=None):
     Returns:
         str: Success or error message
     """
-    if app_id not in appointments:
+    rec = appointments.get(app_id)
+    if rec is None:
         return "Appointment not found."
-    if date_time and not validate_date(date_time):
+    packed = _pack_dt(date_time) if date_time else None
+    if date_time and packed is None:
         return "Invalid date format."
-    if title: appointments[app_id]["title"] = title
-    if date_time: appointments[app_id]["date_time"] = date_time
-    if location: appointments[app_id]["location"] = location
+    if title: rec.title = sys.intern(title)
+    if packed is not None: rec.date_time = packed
+    if location: rec.location = sys.intern(location)
     return f"Appointment '{app_id}' updated."
 
 # ==============================================================================
 # TASK MANAGEMENT FUNCTIONS
 # ==============================================================================
 
-def create_task(task_id, description, due_date):
+def create_task(task_id: str, description: str, due_date: str) -> str:
     """
     Create a new task with validation.
     
@@ -168,12 +294,13 @@ def create_task(task_id, description, due_date):
     Returns:
         str: Success or error message
     """
-    if not validate_date(due_date):
+    packed = _pack_dt(due_date)
+    if packed is None:
         return "Invalid date format. Use YYYY-MM-DD HH:MM"
-    tasks[task_id] = {"description": description, "due_date": due_date}
+    tasks[task_id] = Task(description, packed)
     return f"Task '{description}' created."
 
-def update_task(task_id, description=None, due_date=None):
+def update_task(task_id: str, description: str | None = None, due_date: str | None = None) -> str:
     """
     Update an existing task's information.
     
@@ -185,19 +312,21 @@ def update_task(task_id, description=None, due_date=None):
     Returns:
         str: Success or error message
     """
-    if task_id not in tasks:
+    rec = tasks.get(task_id)
+    if rec is None:
         return "Task not found."
-    if due_date and not validate_date(due_date):
+    packed = _pack_dt(due_date) if due_date else None
+    if due_date and packed is None:
         return "Invalid date format."
-    if description: tasks[task_id]["description"] = description
-    if due_date: tasks[task_id]["due_date"] = due_date
+    if description: rec.description = description
+    if packed is not None: rec.due_date = packed
     return f"Task '{task_id}' updated."
 
 # ==============================================================================
 # DELETE FUNCTIONS
 # ==============================================================================
 
-def delete_contact(contact_id):
+def delete_contact(contact_id: str) -> str:
     """
     Delete a contact from the system.
     
@@ -207,12 +336,11 @@ def delete_contact(contact_id):
     Returns:
         str: Success or error message
     """
-    if contact_id not in contacts:
+    if contacts.pop(contact_id, None) is None:
         return "Contact not found."
-    del contacts[contact_id]
     return f"Contact '{contact_id}' deleted."
 
-def delete_appointment(app_id):
+def delete_appointment(app_id: str) -> str:
     """
     Delete an appointment from the system.
     
@@ -222,12 +350,11 @@ def delete_appointment(app_id):
     Returns:
         str: Success or error message
     """
-    if app_id not in appointments:
+    if appointments.pop(app_id, None) is None:
         return "Appointment not found."
-    del appointments[app_id]
     return f"Appointment '{app_id}' deleted."
 
-def delete_task(task_id):
+def delete_task(task_id: str) -> str:
     """
     Delete a task from the system.
     
@@ -237,16 +364,15 @@ def delete_task(task_id):
     Returns:
         str: Success or error message
     """
-    if task_id not in tasks:
+    if tasks.pop(task_id, None) is None:
         return "Task not found."
-    del tasks[task_id]
     return f"Task '{task_id}' deleted."
 
 # ==============================================================================
 # VIEW FUNCTIONS
 # ==============================================================================
 
-def view_contacts():
+def view_contacts() -> str:
     """
     Display all contacts in a formatted table.
     
@@ -255,12 +381,12 @@ def view_contacts():
     """
     if not contacts:
         return "No contacts found."
-    result = "=== CONTACTS ===\n"
-    for contact_id, info in contacts.items():
-        result += f"ID: {contact_id}\n  Name: {info['name']}\n  Email: {info['email']}\n  Phone: {info['phone']}\n"
-    return result
+    return "=== CONTACTS ===\n" + "".join([
+        f"ID: {contact_id}\n  Name: {info.name}\n  Email: {info.email}\n  Phone: {info.phone:010d}\n"
+        for contact_id, info in contacts.items()
+    ])
 
-def view_appointments():
+def view_appointments() -> str:
     """
     Display all appointments in a formatted table.
     
@@ -269,12 +395,12 @@ def view_appointments():
     """
     if not appointments:
         return "No appointments found."
-    result = "=== APPOINTMENTS ===\n"
-    for app_id, info in appointments.items():
-        result += f"ID: {app_id}\n  Title: {info['title']}\n  Date/Time: {info['date_time']}\n  Location: {info['location']}\n"
-    return result
+    return "=== APPOINTMENTS ===\n" + "".join([
+        f"ID: {app_id}\n  Title: {info.title}\n  Date/Time: {_unpack_dt(info.date_time)}\n  Location: {info.location}\n"
+        for app_id, info in appointments.items()
+    ])
 
-def view_tasks():
+def view_tasks() -> str:
     """
     Display all tasks in a formatted table.
     
@@ -283,245 +409,413 @@ def view_tasks():
     """
     if not tasks:
         return "No tasks found."
-    result = "=== TASKS ===\n"
-    for task_id, info in tasks.items():
-        result += f"ID: {task_id}\n  Description: {info['description']}\n  Due Date: {info['due_date']}\n"
-    return result
+    return "=== TASKS ===\n" + "".join([
+        f"ID: {task_id}\n  Description: {info.description}\n  Due Date: {_unpack_dt(info.due_date)}\n"
+        for task_id, info in tasks.items()
+    ])
+
+def view_all() -> None:
+    """Display all data from all categories."""
+    print(view_contacts())
+    print(view_appointments())
+    print(view_tasks())
+
+# ==============================================================================
+# INPUT HANDLING
+# ==============================================================================
+
+class InputSource:
+    """
+    Line source for the interactive menus.
+    
+    At a terminal, lines are read with input() so line editing still works.
+    When stdin is piped or redirected (scripted/batch runs), lines are pulled
+    straight from the buffered stream instead of going through input().
+    """
+
+    def __init__(self, stream: TextIO | None = None) -> None:
+        """
+        Args:
+            stream (file, optional): Text stream to read; defaults to sys.stdin
+        """
+        self.stream = sys.stdin if stream is None else stream
+        self._lines = None if self.stream.isatty() else iter(self.stream)
+
+    def read(self, prompt: str = "") -> str:
+        """
+        Display a prompt and return the next line of input.
+        
+        Args:
+            prompt (str): Text shown before reading
+            
+        Returns:
+            str: The line read, without its trailing newline
+            
+        Raises:
+            EOFError: If the input is exhausted
+        """
+        if self._lines is None:
+            return input(prompt)
+        sys.stdout.write(prompt)
+        line = next(self._lines, None)
+        if line is None:
+            raise EOFError
+        return line.rstrip("\n")
 
 # ==============================================================================
 # MENU DISPLAY FUNCTIONS
 # ==============================================================================
 # These functions display the various menu options to the user
 
-def print_main_menu():
+# Menu text is assembled and encoded once at import time; at an interactive
+# POSIX terminal it is written with a single os.write on the stdout descriptor
+_MAIN_MENU = (
+    "\n" + "="*40 + "\n"
+    "      CONTACT & TASK MANAGER\n"
+    + "="*40 + "\n"
+    "1. Contact Management\n"
+    "2. Appointment Management\n"
+    "3. Task Management\n"
+    "4. View All\n"
+    "5. Exit\n"
+    + "="*40 + "\n"
+)
+
+_CONTACT_MENU = (
+    "\n--- CONTACT MANAGEMENT ---\n"
+    "1. Create Contact\n"
+    "2. View All Contacts\n"
+    "3. Update Contact\n"
+    "4. Delete Contact\n"
+    "5. Back to Main Menu\n"
+)
+
+_APPOINTMENT_MENU = (
+    "\n--- APPOINTMENT MANAGEMENT ---\n"
+    "1. Create Appointment\n"
+    "2. View All Appointments\n"
+    "3. Update Appointment\n"
+    "4. Delete Appointment\n"
+    "5. Back to Main Menu\n"
+)
+
+_TASK_MENU = (
+    "\n--- TASK MANAGEMENT ---\n"
+    "1. Create Task\n"
+    "2. View All Tasks\n"
+    "3. Update Task\n"
+    "4. Delete Task\n"
+    "5. Back to Main Menu\n"
+)
+
+_MAIN_MENU_BYTES = _MAIN_MENU.encode("utf-8")
+_CONTACT_MENU_BYTES = _CONTACT_MENU.encode("utf-8")
+_APPOINTMENT_MENU_BYTES = _APPOINTMENT_MENU.encode("utf-8")
+_TASK_MENU_BYTES = _TASK_MENU.encode("utf-8")
+
+def _write_menu(text: str, data: bytes) -> None:
+    """
+    Write a menu to stdout.
+    
+    At an interactive POSIX terminal the pre-encoded bytes go straight to
+    the file descriptor, after flushing pending print() output so ordering
+    is preserved. Otherwise (piped or redirected output, Windows newline
+    translation, or a sys.stdout wrapper) the text is written through
+    sys.stdout so it stays in the block buffer and any wrapper still sees it.
+    
+    Args:
+        text (str): Menu text
+        data (bytes): The same menu, pre-encoded
+    """
+    stdout = sys.__stdout__
+    if stdout is None or sys.stdout is not stdout or os.name == "nt" or not stdout.isatty():
+        sys.stdout.write(text)
+        return
+    stdout.flush()
+    fd = stdout.fileno()
+    while data:
+        data = data[os.write(fd, data):]
+
+def print_main_menu() -> None:
     """Display the main application menu."""
-    print("\n" + "="*40)
-    print("      CONTACT & TASK MANAGER")
-    print("="*40)
-    print("1. Contact Management")
-    print("2. Appointment Management")
-    print("3. Task Management")
-    print("4. View All")
-    print("5. Exit")
-    print("="*40)
-
-def print_contact_menu():
+    _write_menu(_MAIN_MENU, _MAIN_MENU_BYTES)
+
+def print_contact_menu() -> None:
     """Display the contact management submenu."""
-    print("\n--- CONTACT MANAGEMENT ---")
-    print("1. Create Contact")
-    print("2. View All Contacts")
-    print("3. Update Contact")
-    print("4. Delete Contact")
-    print("5. Back to Main Menu")
-
-def print_appointment_menu():
+    _write_menu(_CONTACT_MENU, _CONTACT_MENU_BYTES)
+
+def print_appointment_menu() -> None:
     """Display the appointment management submenu."""
-    print("\n--- APPOINTMENT MANAGEMENT ---")
-    print("1. Create Appointment")
-    print("2. View All Appointments")
-    print("3. Update Appointment")
-    print("4. Delete Appointment")
-    print("5. Back to Main Menu")
-
-def print_task_menu():
+    _write_menu(_APPOINTMENT_MENU, _APPOINTMENT_MENU_BYTES)
+
+def print_task_menu() -> None:
     """Display the task management submenu."""
-    print("\n--- TASK MANAGEMENT ---")
-    print("1. Create Task")
-    print("2. View All Tasks")
-    print("3. Update Task")
-    print("4. Delete Task")
-    print("5. Back to Main Menu")
+    _write_menu(_TASK_MENU, _TASK_MENU_BYTES)
 
 # ==============================================================================
 # MANAGEMENT INTERFACE FUNCTIONS
 # ==============================================================================
-# These functions handle the interactive loops for each management category
+# The interactive session is a single loop driven by a state: each state has
+# a menu renderer and a step function that handles one choice and returns
+# the next state (None ends the session). Menu actions are dispatched
+# through per-menu dicts of handlers.
 
-def contact_management():
-    """
-    Handle contact management operations.
-    Provides an interactive loop for creating, viewing, updating, and deleting contacts.
-    """
-    while True:
-        print_contact_menu()
-        choice = input("Enter your choice: ").strip()
-        
-        if choice == "1":
-            # Create a new contact
-            try:
-                contact_id = input("Enter contact ID: ").strip()
-                name = input("Enter name: ").strip()
-                email = input("Enter email: ").strip()
-                phone = input("Enter phone (10 digits): ").strip()
-                print(create_contact(contact_id, name, email, phone))
-            except Exception as e:
-                print(f"Error: {e}")
-                
-        elif choice == "2":
-            # View all contacts
-            print(view_contacts())
-            
-        elif choice == "3":
-            # Update an existing contact
-            try:
-                contact_id = input("Enter contact ID to update: ").strip()
-                if contact_id not in contacts:
-                    print("Contact not found.")
-                    continue
-                name = input("Enter new name (press Enter to skip): ").strip() or None
-                email = input("Enter new email (press Enter to skip): ").strip() or None
-                phone = input("Enter new phone (press Enter to skip): ").strip() or None
-                print(update_contact(contact_id, name, email, phone))
-            except Exception as e:
-                print(f"Error: {e}")
-                
-        elif choice == "4":
-            # Delete a contact
-            try:
-                contact_id = input("Enter contact ID to delete: ").strip()
-                print(delete_contact(contact_id))
-            except Exception as e:
-                print(f"Error: {e}")
-                
-        elif choice == "5":
-            # Return to main menu
-            break
-        else:
-            print("Invalid choice. Please try again.")
+STATE_MAIN = 0
+STATE_CONTACT = 1
+STATE_APPOINTMENT = 2
+STATE_TASK = 3
 
-def appointment_management():
-    """
-    Handle appointment management operations.
-    Provides an interactive loop for creating, viewing, updating, and deleting appointments.
-    """
-    while True:
-        print_appointment_menu()
-        choice = input("Enter your choice: ").strip()
-        
-        if choice == "1":
-            # Create a new appointment
-            try:
-                app_id = input("Enter appointment ID: ").strip()
-                title = input("Enter title: ").strip()
-                date_time = input("Enter date and time (YYYY-MM-DD HH:MM): ").strip()
-                location = input("Enter location: ").strip()
-                print(create_appointment(app_id, title, date_time, location))
-            except Exception as e:
-                print(f"Error: {e}")
-                
-        elif choice == "2":
-            # View all appointments
-            print(view_appointments())
-            
-        elif choice == "3":
-            # Update an existing appointment
-            try:
-                app_id = input("Enter appointment ID to update: ").strip()
-                if app_id not in appointments:
-                    print("Appointment not found.")
-                    continue
-                title = input("Enter new title (press Enter to skip): ").strip() or None
-                date_time = input("Enter new date/time (press Enter to skip): ").strip() or None
-                location = input("Enter new location (press Enter to skip): ").strip() or None
-                print(update_appointment(app_id, title, date_time, location))
-            except Exception as e:
-                print(f"Error: {e}")
-                
-        elif choice == "4":
-            # Delete an appointment
-            try:
-                app_id = input("Enter appointment ID to delete: ").strip()
-                print(delete_appointment(app_id))
-            except Exception as e:
-                print(f"Error: {e}")
-                
-        elif choice == "5":
-            # Return to main menu
-            break
-        else:
-            print("Invalid choice. Please try again.")
+def _invalid_choice(src: InputSource) -> None:
+    """Report an unrecognised menu choice."""
+    print("Invalid choice. Please try again.")
 
-def task_management():
-    """
-    Handle task management operations.
-    Provides an interactive loop for creating, viewing, updating, and deleting tasks.
-    """
-    while True:
-        print_task_menu()
-        choice = input("Enter your choice: ").strip()
-        
-        if choice == "1":
-            # Create a new task
-            try:
-                task_id = input("Enter task ID: ").strip()
-                description = input("Enter description: ").strip()
-                due_date = input("Enter due date (YYYY-MM-DD HH:MM): ").strip()
-                print(create_task(task_id, description, due_date))
-            except Exception as e:
-                print(f"Error: {e}")
-                
-        elif choice == "2":
-            # View all tasks
-            print(view_tasks())
-            
-        elif choice == "3":
-            # Update an existing task
-            try:
-                task_id = input("Enter task ID to update: ").strip()
-                if task_id not in tasks:
-                    print("Task not found.")
-                    continue
-                description = input("Enter new description (press Enter to skip): ").strip() or None
-                due_date = input("Enter new due date (press Enter to skip): ").strip() or None
-                print(update_task(task_id, description, due_date))
-            except Exception as e:
-                print(f"Error: {e}")
-                
-        elif choice == "4":
-            # Delete a task
-            try:
-                task_id = input("Enter task ID to delete: ").strip()
-                print(delete_task(task_id))
-            except Exception as e:
-                print(f"Error: {e}")
-                
-        elif choice == "5":
-            # Return to main menu
-            break
-        else:
-            print("Invalid choice. Please try again.")
+# --- Contact actions ---
 
-def main():
+def _create_contact_action(src: InputSource) -> None:
+    """Prompt for and create a new contact."""
+    try:
+        contact_id = src.read("Enter contact ID: ").strip()
+        name = src.read("Enter name: ").strip()
+        email = src.read("Enter email: ").strip()
+        phone = src.read("Enter phone (10 digits): ").strip()
+        print(create_contact(contact_id, name, email, phone))
+    except EOFError:
+        # Input exhausted: let main() end the session
+        raise
+    except Exception as e:
+        print(f"Error: {e}")
+
+def _view_contacts_action(src: InputSource) -> None:
+    """View all contacts."""
+    print(view_contacts())
+
+def _update_contact_action(src: InputSource) -> None:
+    """Prompt for and update an existing contact."""
+    try:
+        contact_id = src.read("Enter contact ID to update: ").strip()
+        if contact_id not in contacts:
+            print("Contact not found.")
+            return
+        name = src.read("Enter new name (press Enter to skip): ").strip() or None
+        email = src.read("Enter new email (press Enter to skip): ").strip() or None
+        phone = src.read("Enter new phone (press Enter to skip): ").strip() or None
+        print(update_contact(contact_id, name, email, phone))
+    except EOFError:
+        # Input exhausted: let main() end the session
+        raise
+    except Exception as e:
+        print(f"Error: {e}")
+
+def _delete_contact_action(src: InputSource) -> None:
+    """Prompt for and delete a contact."""
+    try:
+        contact_id = src.read("Enter contact ID to delete: ").strip()
+        print(delete_contact(contact_id))
+    except EOFError:
+        # Input exhausted: let main() end the session
+        raise
+    except Exception as e:
+        print(f"Error: {e}")
+
+# --- Appointment actions ---
+
+def _create_appointment_action(src: InputSource) -> None:
+    """Prompt for and create a new appointment."""
+    try:
+        app_id = src.read("Enter appointment ID: ").strip()
+        title = src.read("Enter title: ").strip()
+        date_time = src.read("Enter date and time (YYYY-MM-DD HH:MM): ").strip()
+        location = src.read("Enter location: ").strip()
+        print(create_appointment(app_id, title, date_time, location))
+    except EOFError:
+        # Input exhausted: let main() end the session
+        raise
+    except Exception as e:
+        print(f"Error: {e}")
+
+def _view_appointments_action(src: InputSource) -> None:
+    """View all appointments."""
+    print(view_appointments())
+
+def _update_appointment_action(src: InputSource) -> None:
+    """Prompt for and update an existing appointment."""
+    try:
+        app_id = src.read("Enter appointment ID to update: ").strip()
+        if app_id not in appointments:
+            print("Appointment not found.")
+            return
+        title = src.read("Enter new title (press Enter to skip): ").strip() or None
+        date_time = src.read("Enter new date/time (press Enter to skip): ").strip() or None
+        location = src.read("Enter new location (press Enter to skip): ").strip() or None
+        print(update_appointment(app_id, title, date_time, location))
+    except EOFError:
+        # Input exhausted: let main() end the session
+        raise
+    except Exception as e:
+        print(f"Error: {e}")
+
+def _delete_appointment_action(src: InputSource) -> None:
+    """Prompt for and delete an appointment."""
+    try:
+        app_id = src.read("Enter appointment ID to delete: ").strip()
+        print(delete_appointment(app_id))
+    except EOFError:
+        # Input exhausted: let main() end the session
+        raise
+    except Exception as e:
+        print(f"Error: {e}")
+
+# --- Task actions ---
+
+def _create_task_action(src: InputSource) -> None:
+    """Prompt for and create a new task."""
+    try:
+        task_id = src.read("Enter task ID: ").strip()
+        description = src.read("Enter description: ").strip()
+        due_date = src.read("Enter due date (YYYY-MM-DD HH:MM): ").strip()
+        print(create_task(task_id, description, due_date))
+    except EOFError:
+        # Input exhausted: let main() end the session
+        raise
+    except Exception as e:
+        print(f"Error: {e}")
+
+def _view_tasks_action(src: InputSource) -> None:
+    """View all tasks."""
+    print(view_tasks())
+
+def _update_task_action(src: InputSource) -> None:
+    """Prompt for and update an existing task."""
+    try:
+        task_id = src.read("Enter task ID to update: ").strip()
+        if task_id not in tasks:
+            print("Task not found.")
+            return
+        description = src.read("Enter new description (press Enter to skip): ").strip() or None
+        due_date = src.read("Enter new due date (press Enter to skip): ").strip() or None
+        print(update_task(task_id, description, due_date))
+    except EOFError:
+        # Input exhausted: let main() end the session
+        raise
+    except Exception as e:
+        print(f"Error: {e}")
+
+def _delete_task_action(src: InputSource) -> None:
+    """Prompt for and delete a task."""
+    try:
+        task_id = src.read("Enter task ID to delete: ").strip()
+        print(delete_task(task_id))
+    except EOFError:
+        # Input exhausted: let main() end the session
+        raise
+    except Exception as e:
+        print(f"Error: {e}")
+
+_CONTACT_ACTIONS = {
+    "1": _create_contact_action,
+    "2": _view_contacts_action,
+    "3": _update_contact_action,
+    "4": _delete_contact_action,
+}
+_APPOINTMENT_ACTIONS = {
+    "1": _create_appointment_action,
+    "2": _view_appointments_action,
+    "3": _update_appointment_action,
+    "4": _delete_appointment_action,
+}
+_TASK_ACTIONS = {
+    "1": _create_task_action,
+    "2": _view_tasks_action,
+    "3": _update_task_action,
+    "4": _delete_task_action,
+}
+
+# Main-menu choices that open a submenu
+_SUBMENU_STATES = {"1": STATE_CONTACT, "2": STATE_APPOINTMENT, "3": STATE_TASK}
+
+# --- State step functions ---
+
+def _main_step(src: InputSource, choice: str) -> int | None:
+    """
+    Handle one main-menu choice.
+    
+    Args:
+        src (InputSource): Source of user input
+        choice (str): The menu option entered
+        
+    Returns:
+        int: Next state, or None to exit the application
+    """
+    if choice == "5":
+        # Exit the application
+        print("\nThank you for using Contact & Task Manager. Goodbye!")
+        return None
+    if choice in _SUBMENU_STATES:
+        return _SUBMENU_STATES[choice]
+    if choice == "4":
+        view_all()
+    else:
+        _invalid_choice(src)
+    return STATE_MAIN
+
+def _contact_step(src: InputSource, choice: str) -> int:
+    """Handle one contact-menu choice and return the next state."""
+    if choice == "5":
+        # Return to main menu
+        return STATE_MAIN
+    _CONTACT_ACTIONS.get(choice, _invalid_choice)(src)
+    return STATE_CONTACT
+
+def _appointment_step(src: InputSource, choice: str) -> int:
+    """Handle one appointment-menu choice and return the next state."""
+    if choice == "5":
+        # Return to main menu
+        return STATE_MAIN
+    _APPOINTMENT_ACTIONS.get(choice, _invalid_choice)(src)
+    return STATE_APPOINTMENT
+
+def _task_step(src: InputSource, choice: str) -> int:
+    """Handle one task-menu choice and return the next state."""
+    if choice == "5":
+        # Return to main menu
+        return STATE_MAIN
+    _TASK_ACTIONS.get(choice, _invalid_choice)(src)
+    return STATE_TASK
+
+_MENUS = {
+    STATE_MAIN: print_main_menu,
+    STATE_CONTACT: print_contact_menu,
+    STATE_APPOINTMENT: print_appointment_menu,
+    STATE_TASK: print_task_menu,
+}
+_HANDLERS = {
+    STATE_MAIN: _main_step,
+    STATE_CONTACT: _contact_step,
+    STATE_APPOINTMENT: _appointment_step,
+    STATE_TASK: _task_step,
+}
+
+def main(src: InputSource | None = None) -> None:
     """
     Main application entry point.
-    Displays the main menu and routes user choices to appropriate management functions.
+    Runs the menu state machine from the main menu until the user exits or
+    the input is exhausted.
+    
+    Args:
+        src (InputSource, optional): Source of user input; defaults to stdin
     """
+    if src is None:
+        src = InputSource()
     print("\nWelcome to Contact & Task Manager!")
-    
-    while True:
-        print_main_menu()
-        choice = input("Enter your choice: ").strip()
-        
-        if choice == "1":
-            # Navigate to contact management
-            contact_management()
-        elif choice == "2":
-            # Navigate to appointment management
-            appointment_management()
-        elif choice == "3":
-            # Navigate to task management
-            task_management()
-        elif choice == "4":
-            # Display all data from all categories
-            print(view_contacts())
-            print(view_appointments())
-            print(view_tasks())
-        elif choice == "5":
-            # Exit the application
-            print("\nThank you for using Contact & Task Manager. Goodbye!")
-            break
-        else:
-            print("Invalid choice. Please try again.")
+
+    state: int | None = STATE_MAIN
+    try:
+        while state is not None:
+            _MENUS[state]()
+            state = _HANDLERS[state](src, src.read("Enter your choice: ").strip())
+    except EOFError:
+        # Input exhausted (e.g. end of a piped script): finish the prompt line
+        print()
 
 # ==============================================================================
 # APPLICATION ENTRY POINT